@@ -320,13 +320,18 @@ u_h = fem.Function(V)
 p_h = fem.Function(Q)
 p_h.name = "p"
 offset = V.dofmap.index_map.size_local * V.dofmap.index_map_bs
-u_h.x.array[:offset] = x.array_r[:offset]
+x_r = x.array_r
+u_h.x.array[:offset] = x_r[:offset]
 u_h.x.scatter_forward()
-p_h.x.array[:(len(x.array_r) - offset)] = x.array_r[offset:]
+p_h.x.array[:(len(x_r) - offset)] = x_r[offset:]
 p_h.x.scatter_forward()
 # Subtract the average of the pressure since it is only determined up to
-# a constant
-p_h.x.array[:] -= domain_average(msh, p_h)
+# a constant. The pressure is re-normalised after every time step, so
+# the domain volume is computed and the pressure integral is compiled
+# once here and reused in the time stepping loop.
+vol = msh.comm.allreduce(fem.assemble_scalar(fem.form(fem.Constant(msh, 1.0) * dx)), op=MPI.SUM)
+p_h_int = fem.form(p_h * dx)
+p_h.x.array[:] -= msh.comm.allreduce(fem.assemble_scalar(p_h_int), op=MPI.SUM) / vol
 
 u_vis = fem.Function(W)
 u_vis.name = "u"
@@ -378,11 +383,12 @@ for n in range(num_time_steps):
     # Compute solution
     ksp.solve(b, x)
 
-    u_h.x.array[:offset] = x.array_r[:offset]
+    x_r = x.array_r
+    u_h.x.array[:offset] = x_r[:offset]
     u_h.x.scatter_forward()
-    p_h.x.array[:(len(x.array_r) - offset)] = x.array_r[offset:]
+    p_h.x.array[:(len(x_r) - offset)] = x_r[offset:]
     p_h.x.scatter_forward()
-    p_h.x.array[:] -= domain_average(msh, p_h)
+    p_h.x.array[:] -= msh.comm.allreduce(fem.assemble_scalar(p_h_int), op=MPI.SUM) / vol
 
     u_vis.interpolate(u_h)
 
@@ -110,8 +110,7 @@ msh = create_rectangle(MPI.COMM_WORLD, [np.array([0, 0]), np.array([1, 1])],
 
 # Function to mark x = 0, x = 1 and y = 0
 def noslip_boundary(x):
-    return np.logical_or(np.logical_or(np.isclose(x[0], 0.0), np.isclose(x[0], 1.0)),
-                         np.isclose(x[1], 0.0))
+    return np.isclose(x[0], 0.0) | np.isclose(x[0], 1.0) | np.isclose(x[1], 0.0)
 
 
 # Function to mark the lid (y = 1)
@@ -121,7 +120,9 @@ def lid(x):
 
 # Lid velocity
 def lid_velocity_expression(x):
-    return np.stack((np.ones(x.shape[1]), np.zeros(x.shape[1])))
+    values = np.zeros((2, x.shape[1]), dtype=PETSc.ScalarType)
+    values[0] = 1.0
+    return values
 # -
 
 # Two {py:class}`FunctionSpace <dolfinx.fem.FunctionSpace>`s are defined
@@ -139,14 +140,14 @@ V, Q = FunctionSpace(msh, P2), FunctionSpace(msh, P1)
 # +
 # No-slip condition on boundaries where x = 0, x = 1, and y = 0
 noslip = np.zeros(msh.geometry.dim, dtype=PETSc.ScalarType)
-facets = locate_entities_boundary(msh, 1, noslip_boundary)
-bc0 = dirichletbc(noslip, locate_dofs_topological(V, 1, facets), V)
+noslip_facets = locate_entities_boundary(msh, 1, noslip_boundary)
+bc0 = dirichletbc(noslip, locate_dofs_topological(V, 1, noslip_facets), V)
 
 # Driving (lid) velocity condition on top boundary (y = 1)
 lid_velocity = Function(V)
 lid_velocity.interpolate(lid_velocity_expression)
-facets = locate_entities_boundary(msh, 1, lid)
-bc1 = dirichletbc(lid_velocity, locate_dofs_topological(V, 1, facets))
+lid_facets = locate_entities_boundary(msh, 1, lid)
+bc1 = dirichletbc(lid_velocity, locate_dofs_topological(V, 1, lid_facets))
 
 # Collect Dirichlet boundary conditions
 bcs = [bc0, bc1]
@@ -159,7 +160,7 @@ bcs = [bc0, bc1]
 # Define variational problem
 (u, p) = ufl.TrialFunction(V), ufl.TrialFunction(Q)
 (v, q) = ufl.TestFunction(V), ufl.TestFunction(Q)
-f = Constant(msh, (PETSc.ScalarType(0), PETSc.ScalarType(0)))
+f = Constant(msh, np.zeros(msh.geometry.dim, dtype=PETSc.ScalarType))
 
 a = form([[inner(grad(u), grad(v)) * dx, inner(p, div(v)) * dx],
           [inner(div(u), q) * dx, None]])
@@ -218,13 +219,12 @@ def nested_iterative_solver():
     null_vec = fem.petsc.create_vector_nest(L)
 
     # Set velocity part to zero and the pressure part to a non-zero
-    # constant
+    # constant. The constant is chosen such that the vector has unit
+    # norm, which avoids a separate normalization of the vector.
     null_vecs = null_vec.getNestSubVecs()
-    null_vecs[0].set(0.0), null_vecs[1].set(1.0)
+    null_vecs[0].set(0.0), null_vecs[1].set(1.0 / np.sqrt(Q.dofmap.index_map.size_global))
 
-    # Normalize the vector that spans the nullspace, create a nullspace
-    # object, and attach it to the matrix
-    null_vec.normalize()
+    # Create a nullspace object and attach it to the matrix
     nsp = PETSc.NullSpace().create(vectors=[null_vec])
     assert nsp.test(A)
     A.setNullSpace(nsp)
@@ -263,17 +263,17 @@ def nested_iterative_solver():
     ksp.solve(b, x)
 
     # Save solution to file in XDMF format for visualization, e.g. with
-    # ParaView. Before writing to file, ghost values are updated using
-    # `scatter_forward`.
-    with XDMFFile(MPI.COMM_WORLD, "out_stokes/velocity.xdmf", "w") as ufile_xdmf:
-        u.x.scatter_forward()
-        ufile_xdmf.write_mesh(msh)
-        ufile_xdmf.write_function(u)
-
-    with XDMFFile(MPI.COMM_WORLD, "out_stokes/pressure.xdmf", "w") as pfile_xdmf:
-        p.x.scatter_forward()
-        pfile_xdmf.write_mesh(msh)
-        pfile_xdmf.write_function(p)
+    # ParaView. Both fields are written to the same file so that the
+    # mesh is written only once; the functions are given distinct names
+    # to identify them in the file. Before writing to file, ghost values
+    # are updated using `scatter_forward`.
+    u.name, p.name = "u", "p"
+    u.x.scatter_forward()
+    p.x.scatter_forward()
+    with XDMFFile(MPI.COMM_WORLD, "out_stokes/stokes.xdmf", "w") as file:
+        file.write_mesh(msh)
+        file.write_function(u)
+        file.write_function(p)
 
     # Compute norms of the solution vectors
     norm_u = u.x.norm()
@@ -304,11 +304,11 @@ def block_operators():
     b = fem.petsc.assemble_vector_block(L, a, bcs=bcs)
 
     # Set the nullspace for pressure (since pressure is determined only
-    # up to a constant)
+    # up to a constant). The pressure entries are set such that the
+    # vector has unit norm.
     null_vec = A.createVecLeft()
     offset = V.dofmap.index_map.size_local * V.dofmap.index_map_bs
-    null_vec.array[offset:] = 1.0
-    null_vec.normalize()
+    null_vec.array[offset:] = 1.0 / np.sqrt(Q.dofmap.index_map.size_global)
     nsp = PETSc.NullSpace().create(vectors=[null_vec])
     assert nsp.test(A)
     A.setNullSpace(nsp)
@@ -369,8 +369,9 @@ def block_iterative_solver():
     # Create Functions to split u and p
     u, p = Function(V), Function(Q)
     offset = V_map.size_local * V.dofmap.index_map_bs
-    u.x.array[:offset] = x.array_r[:offset]
-    p.x.array[:(len(x.array_r) - offset)] = x.array_r[offset:]
+    x_r = x.array_r
+    u.x.array[:offset] = x_r[:offset]
+    p.x.array[:(len(x_r) - offset)] = x_r[offset:]
 
     # Compute the $L^2$ norms of the solution vectors
     norm_u, norm_p = u.x.norm(), p.x.norm()
@@ -423,8 +424,9 @@ def block_direct_solver():
     # Create Functions and scatter x solution
     u, p = Function(V), Function(Q)
     offset = V.dofmap.index_map.size_local * V.dofmap.index_map_bs
-    u.x.array[:offset] = x.array_r[:offset]
-    p.x.array[:(len(x.array_r) - offset)] = x.array_r[offset:]
+    x_r = x.array_r
+    u.x.array[:offset] = x_r[:offset]
+    p.x.array[:(len(x_r) - offset)] = x_r[offset:]
 
     # Compute the $L^2$ norms of the u and p vectors
     norm_u, norm_p = u.x.norm(), p.x.norm()
@@ -451,16 +453,14 @@ def mixed_direct():
 
     # No slip boundary condition
     noslip = Function(V)
-    facets = locate_entities_boundary(msh, 1, noslip_boundary)
-    dofs = locate_dofs_topological((W.sub(0), V), 1, facets)
+    dofs = locate_dofs_topological((W.sub(0), V), 1, noslip_facets)
     bc0 = dirichletbc(noslip, dofs, W.sub(0))
 
     # Driving velocity condition u = (1, 0) on top boundary (y = 1)
     W0, _ = W.sub(0).collapse()
     lid_velocity = Function(W0)
     lid_velocity.interpolate(lid_velocity_expression)
-    facets = locate_entities_boundary(msh, 1, lid)
-    dofs = locate_dofs_topological((W.sub(0), V), 1, facets)
+    dofs = locate_dofs_topological((W.sub(0), V), 1, lid_facets)
     bc1 = dirichletbc(lid_velocity, dofs, W.sub(0))
 
     # Collect Dirichlet boundary conditions
@@ -44,9 +44,9 @@ def test_vector_constant():
     mesh = create_unit_cube(MPI.COMM_WORLD, 2, 2, 2)
     c0 = Constant(mesh, [1.0, 2.0])
     c1 = Constant(mesh, np.array([1.0, 2.0]))
-    assert c0.value.all() == c1.value.all()
+    assert np.array_equal(c0.value, c1.value)
     c0.value += 1.0
-    assert c0.value.all() == np.array([2.0, 3.0]).all()
+    assert np.array_equal(c0.value, [2.0, 3.0])
     c0.value -= [1.0, 2.0]
     assert c0.value[0] == c0.value[1]
 
@@ -56,9 +56,9 @@ def test_tensor_constant():
     data = [[1.0, 2.0, 1.0], [1.0, 2.0, 1.0], [1.0, 2.0, 1.0]]
     c0 = Constant(mesh, data)
     assert c0.value.shape == (3, 3)
-    assert c0.value.all() == np.asarray(data).all()
+    assert np.array_equal(c0.value, data)
     c0.value *= 2.0
-    assert c0.value.all() == (2.0 * np.asarray(data)).all()
+    assert np.array_equal(c0.value, 2.0 * np.asarray(data))
 
 
 def test_float_method():